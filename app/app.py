@@ -1,7 +1,7 @@
 import reflex as rx
 import reflex_enterprise as rxe
 from app.components.sidebar import sidebar
-from app.state import State
+from app.state import BUFFER_PATH_OPTIONS, State
 from reflex_enterprise.components.map.types import latlng
 
 
@@ -27,13 +27,19 @@ def map_view() -> rx.Component:
                     rxe.map.circle(
                         center=g["center"],
                         radius=g["radius"],
-                        path_options=g["path_options"],
+                        path_options=BUFFER_PATH_OPTIONS,
+                    ),
+                ),
+                (
+                    "polygon",
+                    rxe.map.polygon(
+                        positions=g["positions"], path_options=BUFFER_PATH_OPTIONS
                     ),
                 ),
                 (
                     "rectangle",
                     rxe.map.rectangle(
-                        bounds=g["bounds"], path_options=g["path_options"]
+                        bounds=g["bounds"], path_options=BUFFER_PATH_OPTIONS
                     ),
                 ),
                 rx.fragment(),
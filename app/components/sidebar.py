@@ -94,6 +94,55 @@ def csv_upload_panel() -> rx.Component:
             on_drop=State.handle_csv_upload,
             class_name="cursor-pointer hover:border-purple-400 transition-colors",
         ),
+        duplicate_handling_controls(),
+    )
+
+
+def _dedup_mode_button(label: str, mode: str, position_class: str) -> rx.Component:
+    """A segmented-control button selecting how duplicates are resolved."""
+    return rx.el.button(
+        label,
+        on_click=lambda: State.set_dedup_mode(mode),
+        class_name=rx.cond(
+            State.dedup_mode == mode,
+            f"flex-1 py-1.5 px-2 text-sm bg-purple-600 text-white border border-purple-600 shadow-sm {position_class}",
+            f"flex-1 py-1.5 px-2 text-sm bg-white text-gray-700 border border-gray-300 hover:bg-gray-50 {position_class}",
+        ),
+    )
+
+
+def duplicate_handling_controls() -> rx.Component:
+    """Controls for duplicate detection applied to every new point."""
+    return rx.el.div(
+        rx.el.label(
+            "Duplicates", class_name="block text-sm font-medium text-gray-700 mb-2"
+        ),
+        rx.el.div(
+            _dedup_mode_button("Drop", "drop", "rounded-l-lg"),
+            _dedup_mode_button("Merge", "merge", "border-l-0"),
+            _dedup_mode_button("Snap", "snap", "border-l-0 rounded-r-lg"),
+            class_name="flex w-full",
+        ),
+        rx.el.div(
+            rx.el.label(
+                "Tolerance (m)",
+                class_name="text-sm text-gray-600 whitespace-nowrap",
+            ),
+            rx.el.input(
+                default_value=State.dedup_tolerance.to_string(),
+                on_change=State.set_dedup_tolerance,
+                type="number",
+                min="0",
+                class_name="w-full px-3 py-1.5 bg-white border border-gray-300 rounded-lg shadow-sm focus:outline-none focus:ring-2 focus:ring-purple-500 focus:border-transparent transition-all",
+            ),
+            class_name="flex items-center gap-3 mt-3",
+        ),
+        rx.cond(
+            State.ingest_summary != "",
+            rx.el.p(State.ingest_summary, class_name="mt-2 text-xs text-gray-500"),
+            None,
+        ),
+        class_name="mt-4",
     )
 
 
@@ -191,6 +240,34 @@ def buffer_config_panel() -> rx.Component:
             ),
             class_name="mb-4",
         ),
+        rx.el.div(
+            rx.el.label(
+                "Buffer Method",
+                class_name="block text-sm font-medium text-gray-700 mb-2",
+            ),
+            rx.el.div(
+                rx.el.button(
+                    "Planar",
+                    on_click=lambda: State.set_buffer_geodesic(False),
+                    class_name=rx.cond(
+                        ~State.buffer_geodesic,
+                        "flex-1 flex items-center justify-center py-2 px-3 bg-purple-600 text-white rounded-l-lg shadow-sm z-10",
+                        "flex-1 flex items-center justify-center py-2 px-3 bg-white text-gray-700 border border-gray-300 rounded-l-lg hover:bg-gray-50",
+                    ),
+                ),
+                rx.el.button(
+                    "Geodesic (WGS84)",
+                    on_click=lambda: State.set_buffer_geodesic(True),
+                    class_name=rx.cond(
+                        State.buffer_geodesic,
+                        "flex-1 flex items-center justify-center py-2 px-3 bg-purple-600 text-white rounded-r-lg shadow-sm z-10 border-t border-b border-purple-600",
+                        "flex-1 flex items-center justify-center py-2 px-3 bg-white text-gray-700 border border-l-0 border-gray-300 rounded-r-lg hover:bg-gray-50",
+                    ),
+                ),
+                class_name="flex w-full",
+            ),
+            class_name="mb-4",
+        ),
         rx.el.div(
             rx.el.label(
                 "Distance", class_name="block text-sm font-medium text-gray-700 mb-1"
@@ -240,6 +317,13 @@ def results_panel() -> rx.Component:
                 rx.el.p(State.result_summary["shape"], class_name=summary_value_class),
                 class_name=summary_item_class,
             ),
+            rx.el.div(
+                rx.el.p("Method", class_name=summary_label_class),
+                rx.el.p(
+                    State.result_summary["method"], class_name=summary_value_class
+                ),
+                class_name=summary_item_class,
+            ),
             rx.el.div(
                 rx.el.p("Distance", class_name=summary_label_class),
                 rx.el.p(
@@ -0,0 +1,196 @@
+import math
+from typing import Sequence
+
+WGS84_A = 6378137.0
+WGS84_F = 1 / 298.257223563
+WGS84_B = (1 - WGS84_F) * WGS84_A
+RING_VERTICES = 32
+
+_E2 = WGS84_F * (2 - WGS84_F)
+_EP2 = (WGS84_A**2 - WGS84_B**2) / WGS84_B**2
+_MAX_LAT = 90.0 - 1e-9
+# The third-order series is within ~s**4 * (1.6e-21 * |sin(lat)| / cos(lat)**3
+# + 1e-23) meters of the exact solution (checked against GeographicLib); it is
+# used while that bound stays under a centimetre and Vincenty takes over beyond.
+_SERIES_ERROR_COEFF = 1.6e-21
+_SERIES_ERROR_FLOOR = 1e-23
+_SERIES_MAX_ERROR_M = 1e-2
+
+
+def _bearing_table(bearings: Sequence[float]) -> list[tuple[float, float]]:
+    return [(math.sin(math.radians(b)), math.cos(math.radians(b))) for b in bearings]
+
+
+# Counter-clockwise from due east, matching the planar ring and RFC 7946's
+# winding for exterior rings.
+RING_BEARINGS = [
+    (90.0 - i / RING_VERTICES * 360.0) % 360.0 for i in range(RING_VERTICES)
+]
+_RING_TABLE = _bearing_table(RING_BEARINGS)
+_CARDINAL_TABLE = _bearing_table((0.0, 90.0, 180.0, 270.0))
+
+
+def _series_ring(
+    lat: float, lng: float, distance_m: float, table: list[tuple[float, float]]
+) -> list[tuple[float, float]]:
+    """Third-order Taylor expansion of the geodesic about the center.
+
+    Differentiates the geodesic equations dlat/ds = cos(a) / M, dlng/ds =
+    sin(a) / (N cos(lat)) and da/ds = sin(a) tan(lat) / N, where M and N are
+    the meridional and prime-vertical radii of curvature. The coefficients
+    depend only on the center, so a vertex costs a handful of multiply-adds.
+    """
+    phi = math.radians(lat)
+    sin_p = math.sin(phi)
+    cos_p = math.cos(phi)
+    tan_p = sin_p / cos_p
+    w2 = 1 - _E2 * sin_p * sin_p
+    w = math.sqrt(w2)
+    k = WGS84_A * (1 - _E2)
+    # w = sqrt(1 - e^2 sin^2(lat)) and its derivatives with respect to lat.
+    w_d = -_E2 * sin_p * cos_p / w
+    w_dd = -(_E2 * (cos_p * cos_p - sin_p * sin_p) + w_d * w_d) / w
+    # P = 1/M, Q = tan(lat)/N and R = 1/(N cos(lat)) with their derivatives.
+    p = w2 * w / k
+    p_d = 3 * w2 * w_d / k
+    p_dd = (6 * w * w_d * w_d + 3 * w2 * w_dd) / k
+    q = tan_p * w / WGS84_A
+    q_d = (w / (cos_p * cos_p) + tan_p * w_d) / WGS84_A
+    r = w / (WGS84_A * cos_p)
+    r_d = (w_d + w * tan_p) / (WGS84_A * cos_p)
+    r_dd = (w_dd + 2 * w_d * tan_p + w * (tan_p * tan_p + 1 / (cos_p * cos_p))) / (
+        WGS84_A * cos_p
+    )
+    pp_d = p * p_d
+    sv = q * r + p * r_d
+    sv_d = q_d * r + q * r_d + p_d * r_d + p * r_dd
+
+    s = distance_m
+    s2 = s * s / 2
+    s3 = s * s * s / 6
+    lat1 = s * p
+    lat_cos2 = s2 * pp_d
+    lat_sin2 = -s2 * p * q
+    lat_cos3 = s3 * p * (p_d * p_d + p * p_dd)
+    lat_sin2cos = -s3 * (2 * p * q * q + p * (p_d * q + p * q_d) + 2 * q * pp_d)
+    lng1 = s * r
+    lng_cos = s2 * sv
+    lng_cos2 = s3 * (q * sv + p * sv_d)
+    lng_sin2 = -s3 * q * sv
+    to_deg = 180.0 / math.pi
+    ring = []
+    for sin_a, cos_a in table:
+        sin2 = sin_a * sin_a
+        cos2 = cos_a * cos_a
+        dphi = (
+            lat1 * cos_a
+            + lat_cos2 * cos2
+            + lat_sin2 * sin2
+            + (lat_cos3 * cos2 + lat_sin2cos * sin2) * cos_a
+        )
+        dlmb = (lng1 + lng_cos * cos_a + lng_cos2 * cos2 + lng_sin2 * sin2) * sin_a
+        ring.append((lat + dphi * to_deg, lng + dlmb * to_deg))
+    return ring
+
+
+def _destinations(
+    centers: Sequence[tuple[float, float]],
+    distance_m: float,
+    table: list[tuple[float, float]],
+) -> list[list[tuple[float, float]]]:
+    """Solves the direct geodesic problem for every center and bearing.
+
+    Buffer-scale distances use the closed-form series above. Longer distances,
+    or centers close enough to a pole for the series bound to exceed a
+    centimetre, fall back to Vincenty, with bearing trigonometry shared across
+    all centers and the reduced-latitude terms across all bearings of a center.
+    Longitudes are left unwrapped so every ring stays continuous with its
+    center, as the planar buffers do.
+    """
+    f = WGS84_F
+    sin, cos, atan2, sqrt = math.sin, math.cos, math.atan2, math.sqrt
+    s4 = abs(distance_m) ** 4
+    results = []
+    for lat, lng in centers:
+        phi = math.radians(lat)
+        cos3 = math.cos(phi) ** 3
+        error = s4 * (
+            _SERIES_ERROR_COEFF * abs(math.sin(phi)) + _SERIES_ERROR_FLOOR * cos3
+        )
+        if error <= _SERIES_MAX_ERROR_M * cos3:
+            results.append(_series_ring(lat, lng, distance_m, table))
+            continue
+        phi1 = math.radians(max(-_MAX_LAT, min(_MAX_LAT, lat)))
+        tan_u1 = (1 - f) * math.tan(phi1)
+        cos_u1 = 1 / sqrt(1 + tan_u1 * tan_u1)
+        sin_u1 = tan_u1 * cos_u1
+        ring = []
+        for sin_a1, cos_a1 in table:
+            sigma1 = atan2(tan_u1, cos_a1)
+            sin_alpha = cos_u1 * sin_a1
+            cos2_alpha = 1 - sin_alpha * sin_alpha
+            u2 = cos2_alpha * _EP2
+            big_a = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+            big_b = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+            sigma0 = distance_m / (WGS84_B * big_a)
+            sigma = sigma0
+            for _ in range(100):
+                cos_2sm = cos(2 * sigma1 + sigma)
+                sin_s = sin(sigma)
+                cos_s = cos(sigma)
+                delta = (
+                    big_b
+                    * sin_s
+                    * (
+                        cos_2sm
+                        + big_b
+                        / 4
+                        * (
+                            cos_s * (-1 + 2 * cos_2sm * cos_2sm)
+                            - big_b
+                            / 6
+                            * cos_2sm
+                            * (-3 + 4 * sin_s * sin_s)
+                            * (-3 + 4 * cos_2sm * cos_2sm)
+                        )
+                    )
+                )
+                previous, sigma = sigma, sigma0 + delta
+                if abs(sigma - previous) < 1e-12:
+                    break
+            cos_2sm = cos(2 * sigma1 + sigma)
+            sin_s = sin(sigma)
+            cos_s = cos(sigma)
+            x = sin_u1 * sin_s - cos_u1 * cos_s * cos_a1
+            phi2 = atan2(
+                sin_u1 * cos_s + cos_u1 * sin_s * cos_a1,
+                (1 - f) * sqrt(sin_alpha * sin_alpha + x * x),
+            )
+            lmb = atan2(sin_s * sin_a1, cos_u1 * cos_s - sin_u1 * sin_s * cos_a1)
+            c = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+            big_l = lmb - (1 - c) * f * sin_alpha * (
+                sigma
+                + c * sin_s * (cos_2sm + c * cos_s * (-1 + 2 * cos_2sm * cos_2sm))
+            )
+            ring.append((math.degrees(phi2), lng + math.degrees(big_l)))
+        results.append(ring)
+    return results
+
+
+def geodesic_rings(
+    centers: Sequence[tuple[float, float]], radius_m: float
+) -> list[list[tuple[float, float]]]:
+    """Returns a ring of `RING_VERTICES` (lat, lng) vertices around each center."""
+    return _destinations(centers, radius_m, _RING_TABLE)
+
+
+def geodesic_boxes(
+    centers: Sequence[tuple[float, float]], half_side_m: float
+) -> list[tuple[float, float, float, float]]:
+    """Returns (south, west, north, east) bounds `half_side_m` from each center."""
+    boxes = []
+    for north, east, south, west in _destinations(
+        centers, half_side_m, _CARDINAL_TABLE
+    ):
+        boxes.append((south[0], west[1], north[0], east[1]))
+    return boxes
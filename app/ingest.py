@@ -0,0 +1,190 @@
+import math
+from typing import Iterable, Optional, TypedDict
+
+EARTH_RADIUS_M = 6371008.8
+METERS_PER_DEGREE = EARTH_RADIUS_M * math.pi / 180
+DEDUP_MODES = ("drop", "merge", "snap")
+# Cells are keyed by a single int, row * _ROW_STRIDE + column, which is much
+# smaller per stored point than a (row, column) tuple. Columns stay below the
+# stride for tolerances over ~1 cm; below that, colliding cells only add
+# candidates that the distance check rejects.
+_ROW_STRIDE = 1 << 32
+
+
+class IngestResult(TypedDict):
+    added: int
+    dropped: int
+    merged: int
+    snapped: int
+
+
+def _distance_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle (haversine) distance in meters."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lng2 - lng1)
+    a = (
+        math.sin(dphi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+class HashGrid:
+    """Buckets coordinates into cells at least `tolerance` meters on a side.
+
+    Any point within `tolerance` of a query can then only sit in the 3x3 block
+    of cells around it, so a lookup is O(1) regardless of how many points are
+    stored. Columns wrap at the antimeridian. A tolerance of 0 degrades to
+    exact coordinate matching.
+    """
+
+    def __init__(self, tolerance: float):
+        self.tolerance = max(tolerance, 0.0)
+        self.lat_step = self.tolerance / METERS_PER_DEGREE
+        self.cells: dict[object, list[int]] = {}
+        self.stale = False
+
+    def __getstate__(self) -> dict:
+        # The index is rebuilt cheaply from the points it covers, so keep it out
+        # of pickled session state; an unpickled grid is marked stale instead.
+        return {"tolerance": self.tolerance}
+
+    def __setstate__(self, state: dict):
+        self.__init__(state["tolerance"])
+        self.stale = True
+
+    @classmethod
+    def from_points(cls, points: list[dict], tolerance: float) -> "HashGrid":
+        grid = cls(tolerance)
+        for i, p in enumerate(points):
+            grid.add(i, p["lat"], p["lng"])
+        return grid
+
+    def _row_columns(self, row: int) -> tuple[int, float]:
+        """Number of longitude cells in a row and their width in degrees.
+
+        Widths are sized for the row's most poleward edge, widened by one row on
+        each side so that a query coming from a neighbouring row cannot fall
+        more than one cell away, then rounded up so the row tiles 360 degrees.
+        """
+        edge = max(abs((row - 1) * self.lat_step), abs((row + 2) * self.lat_step))
+        cos_lat = math.cos(math.radians(min(edge, 90.0)))
+        min_step = self.tolerance / (METERS_PER_DEGREE * max(cos_lat, 1e-9))
+        count = max(1, math.floor(360.0 / min_step))
+        return count, 360.0 / count
+
+    def _column(self, row: int, lng: float) -> int:
+        count, step = self._row_columns(row)
+        return math.floor((lng + 180.0) / step) % count
+
+    def _key(self, lat: float, lng: float) -> object:
+        if self.tolerance == 0:
+            return (lat, lng)
+        row = math.floor(lat / self.lat_step)
+        return row * _ROW_STRIDE + self._column(row, lng)
+
+    def add(self, index: int, lat: float, lng: float):
+        key = self._key(lat, lng)
+        bucket = self.cells.get(key)
+        if bucket is None:
+            # Most cells hold one point; a literal avoids append's overallocation.
+            self.cells[key] = [index]
+        else:
+            bucket.append(index)
+
+    def move(self, index: int, lat: float, lng: float, new_lat: float, new_lng: float):
+        key = self._key(lat, lng)
+        self.cells[key].remove(index)
+        if not self.cells[key]:
+            del self.cells[key]
+        self.add(index, new_lat, new_lng)
+
+    def find(self, lat: float, lng: float, points: list[dict]) -> Optional[int]:
+        """Returns the index of the first stored point within tolerance, if any."""
+        if self.tolerance == 0:
+            matches = self.cells.get((lat, lng))
+            return matches[0] if matches else None
+        row = math.floor(lat / self.lat_step)
+        for r in (row - 1, row, row + 1):
+            count, _ = self._row_columns(r)
+            col = self._column(r, lng)
+            for c in {(col - 1) % count, col, (col + 1) % count}:
+                for i in self.cells.get(r * _ROW_STRIDE + c, ()):
+                    p = points[i]
+                    if _distance_m(lat, lng, p["lat"], p["lng"]) <= self.tolerance:
+                        return i
+        return None
+
+
+def ingest_points(
+    points: list[dict],
+    incoming: Iterable[dict],
+    grid: HashGrid,
+    mode: str = "drop",
+) -> IngestResult:
+    """Adds `incoming` points to `points` in place, resolving duplicates.
+
+    `grid` must index `points` and is kept in sync, so each incoming point costs
+    O(1) however many points are already stored. A point is a duplicate when it
+    lies within the grid's tolerance of a point already kept. Depending on
+    `mode`, duplicates are dropped, merged into the kept point (names joined,
+    coordinates averaged) or snapped onto the kept point's exact coordinates so
+    they share a single buffer downstream.
+    """
+    if mode not in DEDUP_MODES:
+        raise ValueError(f"Unknown duplicate mode: {mode}")
+    clusters: dict[int, list] = {}
+    added = dropped = merged = snapped = 0
+    for p in incoming:
+        match = grid.find(p["lat"], p["lng"], points)
+        if match is None:
+            grid.add(len(points), p["lat"], p["lng"])
+            points.append({"name": p["name"], "lat": p["lat"], "lng": p["lng"]})
+            added += 1
+        elif mode == "drop":
+            dropped += 1
+        elif mode == "merge":
+            anchor = points[match]
+            cluster = clusters.setdefault(
+                match, [anchor["lat"], anchor["lng"], 1, [anchor["name"]]]
+            )
+            cluster[0] += p["lat"]
+            # Unwrap relative to the anchor so clusters straddling ±180 average
+            # to a nearby longitude instead of the far side of the globe.
+            cluster[1] += anchor["lng"] + (p["lng"] - anchor["lng"] + 180) % 360 - 180
+            cluster[2] += 1
+            if p["name"] not in cluster[3]:
+                cluster[3].append(p["name"])
+            merged += 1
+        else:
+            anchor = points[match]
+            points.append(
+                {"name": p["name"], "lat": anchor["lat"], "lng": anchor["lng"]}
+            )
+            snapped += 1
+    for i, (sum_lat, sum_lng, count, names) in clusters.items():
+        point = points[i]
+        lat = round(sum_lat / count, 6)
+        lng = round((sum_lng / count + 180) % 360 - 180, 6)
+        grid.move(i, point["lat"], point["lng"], lat, lng)
+        point["lat"] = lat
+        point["lng"] = lng
+        point["name"] = " + ".join(names)
+    return {
+        "added": added,
+        "dropped": dropped,
+        "merged": merged,
+        "snapped": snapped,
+    }
+
+
+def format_ingest_summary(result: IngestResult) -> str:
+    """Human readable one-liner describing an ingest result."""
+    parts = [f"Added {result['added']} point{'s' if result['added'] != 1 else ''}"]
+    for key in ("dropped", "merged", "snapped"):
+        count = result[key]
+        if count:
+            parts.append(f"{key} {count} duplicate{'s' if count != 1 else ''}")
+    return ", ".join(parts) + "."
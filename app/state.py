@@ -4,12 +4,44 @@ import csv
 import io
 import logging
 import json
+import math
 from reflex_enterprise.components.map.types import (
     LatLng,
     latlng,
     LatLngBounds,
     latlng_bounds,
 )
+from app.geodesy import RING_VERTICES, geodesic_boxes, geodesic_rings
+from app.ingest import (
+    DEDUP_MODES,
+    HashGrid,
+    IngestResult,
+    format_ingest_summary,
+    ingest_points,
+)
+
+# Buffer styling is applied by the map component, so it stays out of per-session
+# state. The default center is a tuple so no session can mutate a shared dict.
+DEFAULT_MAP_CENTER = (40.7128, -74.006)
+DEFAULT_MAP_ZOOM = 4.0
+BUFFER_PATH_OPTIONS = {
+    "color": "#8B5CF6",
+    "fillColor": "#A78BFA",
+    "fillOpacity": 0.3,
+}
+_DUPLICATE_TOASTS = {
+    "dropped": "Duplicate point ignored.",
+    "merged": "Duplicate point merged into an existing point.",
+    "snapped": "Duplicate point snapped onto an existing point.",
+}
+_UNIT_CIRCLE = [
+    (math.cos(a), math.sin(a))
+    for a in (i / RING_VERTICES * 2 * math.pi for i in range(RING_VERTICES))
+]
+
+
+def _default_map_center() -> LatLng:
+    return latlng(lat=DEFAULT_MAP_CENTER[0], lng=DEFAULT_MAP_CENTER[1])
 
 
 class Point(TypedDict):
@@ -28,10 +60,15 @@ class State(rx.State):
     buffer_type: str = "circle"
     buffer_distance: float = 1000.0
     buffer_unit: str = "meters"
+    buffer_geodesic: bool = False
     input_error: str = ""
-    map_center: LatLng = latlng(lat=40.7128, lng=-74.006)
-    map_zoom: float = 4.0
+    map_center: LatLng = _default_map_center()
+    map_zoom: float = DEFAULT_MAP_ZOOM
     map_max_bounds: Optional[LatLngBounds] = None
+    dedup_mode: str = "drop"
+    dedup_tolerance: float = 1.0
+    ingest_summary: str = ""
+    _grid: Optional[HashGrid] = None
 
     @rx.event
     def set_point_name(self, value: str):
@@ -59,20 +96,25 @@ class State(rx.State):
             if not -180 <= lng <= 180:
                 raise ValueError("Longitude must be between -180 and 180.")
             new_point: Point = {"name": self.point_name, "lat": lat, "lng": lng}
-            self.points.append(new_point)
-            self.point_name = ""
-            self.latitude = ""
-            self.longitude = ""
+            result = self._ingest([new_point])
+            if result["added"]:
+                self.point_name = ""
+                self.latitude = ""
+                self.longitude = ""
             self.input_error = ""
         except ValueError as e:
             logging.exception(f"Error adding point: {e}")
             self.input_error = f"Invalid coordinates: {e}"
+            result = None
         self._update_map_view()
+        if result:
+            return self._duplicate_toast(result)
 
     @rx.event
     def delete_point(self, point_name: str):
         """Deletes a point from the list."""
         self.points = [p for p in self.points if p["name"] != point_name]
+        self._grid = None
         self._update_map_view()
 
     @rx.event
@@ -99,9 +141,12 @@ class State(rx.State):
                 except (ValueError, KeyError) as e:
                     logging.exception(f"Skipping invalid row in CSV: {row} - {e}")
                     continue
-            self.points.extend(new_points)
+            result = self._ingest(new_points)
+            self.ingest_summary = format_ingest_summary(result)
             self.input_error = ""
             self._update_map_view()
+            if result["added"] != len(new_points):
+                return rx.toast(self.ingest_summary)
         except Exception as e:
             logging.exception(f"Failed to process CSV: {e}")
             self.input_error = f"Failed to process CSV: {e}"
@@ -110,21 +155,44 @@ class State(rx.State):
     def set_buffer_type(self, type: str):
         self.buffer_type = type
 
+    @rx.event
+    def set_buffer_geodesic(self, geodesic: bool):
+        self.buffer_geodesic = geodesic
+
     @rx.event
     def set_buffer_distance(self, distance: str):
         try:
-            self.buffer_distance = float(distance)
+            value = float(distance)
         except ValueError as e:
             logging.exception(f"Invalid buffer distance value: {distance} - {e}")
-            pass
+            return
+        if not (math.isfinite(value) and value > 0):
+            logging.warning(f"Buffer distance must be a positive number: {distance}")
+            return
+        self.buffer_distance = value
+
+    @rx.event
+    def set_dedup_mode(self, mode: str):
+        if mode in DEDUP_MODES:
+            self.dedup_mode = mode
+
+    @rx.event
+    def set_dedup_tolerance(self, tolerance: str):
+        try:
+            self.dedup_tolerance = max(float(tolerance), 0.0)
+            self._grid = None
+        except ValueError as e:
+            logging.exception(f"Invalid duplicate tolerance value: {tolerance} - {e}")
 
     @rx.event
     def clear_all_points(self):
         self.points = []
+        self._grid = None
         self.input_error = ""
+        self.ingest_summary = ""
         self.map_max_bounds = None
-        self.map_center = latlng(lat=40.7128, lng=-74.006)
-        self.map_zoom = 4.0
+        self.map_center = _default_map_center()
+        self.map_zoom = DEFAULT_MAP_ZOOM
 
     @rx.event
     def handle_map_click(self, event: dict):
@@ -133,15 +201,36 @@ class State(rx.State):
         lng = round(event["latlng"]["lng"], 6)
         new_point_name = f"Point {len(self.points) + 1}"
         new_point: Point = {"name": new_point_name, "lat": lat, "lng": lng}
-        self.points.append(new_point)
+        result = self._ingest([new_point])
         self._update_map_view()
+        return self._duplicate_toast(result)
+
+    def _ingest(self, new_points: list[Point]) -> IngestResult:
+        """Adds points through the duplicate-detecting hash grid.
+
+        The grid is cached per session and only rebuilt after points are
+        deleted, the tolerance changes or the state was restored from storage
+        (the grid is not persisted), so each new point costs O(1).
+        """
+        grid = self._grid
+        if grid is None or grid.stale:
+            grid = HashGrid.from_points(self.points, self.dedup_tolerance)
+        result = ingest_points(self.points, new_points, grid, self.dedup_mode)
+        self._grid = grid
+        return result
+
+    def _duplicate_toast(self, result: IngestResult):
+        """Toast telling the user how a duplicate point was resolved, if any."""
+        for key, message in _DUPLICATE_TOASTS.items():
+            if result[key]:
+                return rx.toast(message)
 
     def _update_map_view(self):
         """Helper to update map bounds and center based on points."""
         if not self.points:
             self.map_max_bounds = None
-            self.map_center = latlng(lat=40.7128, lng=-74.006)
-            self.map_zoom = 4.0
+            self.map_center = _default_map_center()
+            self.map_zoom = DEFAULT_MAP_ZOOM
             return
         lats = [p["lat"] for p in self.points]
         lngs = [p["lng"] for p in self.points]
@@ -166,43 +255,55 @@ class State(rx.State):
         """Computes buffer geometries for the map."""
         if not self.points:
             return []
+        centers = list(dict.fromkeys((p["lat"], p["lng"]) for p in self.points))
         geometries = []
-        for point in self.points:
+        if self.buffer_geodesic:
+            if self.buffer_type == "circle":
+                # Leaflet takes (lat, lng) pairs as positions, so the rings are
+                # kept as solved; a LatLng dict per vertex more than doubled
+                # the memory a session spends on its cached buffers.
+                for ring in geodesic_rings(centers, self.buffer_distance):
+                    geometries.append({"type": "polygon", "positions": ring})
+            elif self.buffer_type == "square":
+                for south, west, north, east in geodesic_boxes(
+                    centers, self.buffer_distance / 2
+                ):
+                    geometries.append(
+                        {
+                            "type": "rectangle",
+                            "bounds": latlng_bounds(
+                                corner1_lat=south,
+                                corner1_lng=west,
+                                corner2_lat=north,
+                                corner2_lng=east,
+                            ),
+                        }
+                    )
+            return geometries
+        for lat, lng in centers:
             if self.buffer_type == "circle":
                 geometries.append(
                     {
                         "type": "circle",
-                        "center": latlng(lat=point["lat"], lng=point["lng"]),
+                        "center": latlng(lat=lat, lng=lng),
                         "radius": self.buffer_distance,
-                        "path_options": {
-                            "color": "#8B5CF6",
-                            "fillColor": "#A78BFA",
-                            "fillOpacity": 0.3,
-                        },
                     }
                 )
             elif self.buffer_type == "square":
-                import math
-
                 lat_deg_per_meter = 1 / 111132.954
-                lng_deg_per_meter = 1 / (111320 * math.cos(math.radians(point["lat"])))
+                lng_deg_per_meter = 1 / (111320 * math.cos(math.radians(lat)))
                 lat_offset = self.buffer_distance / 2 * lat_deg_per_meter
                 lng_offset = self.buffer_distance / 2 * lng_deg_per_meter
                 bounds = latlng_bounds(
-                    corner1_lat=point["lat"] - lat_offset,
-                    corner1_lng=point["lng"] - lng_offset,
-                    corner2_lat=point["lat"] + lat_offset,
-                    corner2_lng=point["lng"] + lng_offset,
+                    corner1_lat=lat - lat_offset,
+                    corner1_lng=lng - lng_offset,
+                    corner2_lat=lat + lat_offset,
+                    corner2_lng=lng + lng_offset,
                 )
                 geometries.append(
                     {
                         "type": "rectangle",
                         "bounds": bounds,
-                        "path_options": {
-                            "color": "#8B5CF6",
-                            "fillColor": "#A78BFA",
-                            "fillOpacity": 0.3,
-                        },
                     }
                 )
         return geometries
@@ -217,6 +318,7 @@ class State(rx.State):
             "buffers": num_buffers,
             "distance": f"{self.buffer_distance:.2f} meters",
             "shape": self.buffer_type.capitalize(),
+            "method": "Geodesic" if self.buffer_geodesic else "Planar",
         }
 
     def _get_geojson_data(self) -> dict:
@@ -235,8 +337,6 @@ class State(rx.State):
             )
         for geometry in self.buffer_geometries:
             if geometry["type"] == "circle":
-                import math
-
                 center_lat = geometry["center"]["lat"]
                 center_lng = geometry["center"]["lng"]
                 radius_m = geometry["radius"]
@@ -244,12 +344,10 @@ class State(rx.State):
                 lng_deg_per_meter = 1 / (111320 * math.cos(math.radians(center_lat)))
                 lat_radius = radius_m * lat_deg_per_meter
                 lng_radius = radius_m * lng_deg_per_meter
-                circle_points = []
-                for i in range(32):
-                    angle = i / 32 * 2 * math.pi
-                    dx = lng_radius * math.cos(angle)
-                    dy = lat_radius * math.sin(angle)
-                    circle_points.append([center_lng + dx, center_lat + dy])
+                circle_points = [
+                    [center_lng + lng_radius * cos_a, center_lat + lat_radius * sin_a]
+                    for cos_a, sin_a in _UNIT_CIRCLE
+                ]
                 circle_points.append(circle_points[0])
                 features.append(
                     {
@@ -258,6 +356,16 @@ class State(rx.State):
                         "properties": {"type": "buffer", "shape": "circle"},
                     }
                 )
+            elif geometry["type"] == "polygon":
+                ring = [[lng, lat] for lat, lng in geometry["positions"]]
+                ring.append(ring[0])
+                features.append(
+                    {
+                        "type": "Feature",
+                        "geometry": {"type": "Polygon", "coordinates": [ring]},
+                        "properties": {"type": "buffer", "shape": "circle"},
+                    }
+                )
             elif geometry["type"] == "rectangle":
                 bounds = geometry["bounds"]
                 coords = [
@@ -0,0 +1,131 @@
+"""Reports worker cold-start and per-session memory footprint.
+
+Measures the import time of the app modules in fresh interpreters, checks that
+export-only machinery stays unloaded after import, and reports how many bytes a
+session's state takes in memory (tracemalloc) and once serialized.
+
+    python scripts/footprint.py --runs 5 --sessions 200
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Export-only modules the app itself must not import at startup. Anything that
+# reflex.state already pulls in (csv, json and zipfile via importlib.metadata)
+# is subtracted first, so only imports made by the app are reported.
+LAZY_MODULES = ("shapefile", "zipfile", "csv", "json")
+_TIMING_PROBE = """
+import time
+start = time.perf_counter()
+import {module}
+print("elapsed", time.perf_counter() - start)
+"""
+_LAZY_PROBE = """
+import sys
+import reflex.state
+before = set(sys.modules)
+import {module}
+print("loaded", *(m for m in {lazy!r} if m in sys.modules and m not in before))
+"""
+
+
+def _probe(code: str, module: str, marker: str) -> list[str]:
+    """Runs `code` in a fresh interpreter and returns the fields after `marker`.
+
+    Some imports bail out early (reflex-enterprise exits when not logged in),
+    so a missing marker line is reported as a failed import.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    lines = result.stdout.strip().splitlines()
+    for line in reversed(lines):
+        fields = line.split()
+        if fields and fields[0] == marker:
+            return fields[1:]
+    raise RuntimeError(f"importing {module} failed: {(lines or ['no output'])[-1]}")
+
+
+def measure_import(module: str, runs: int) -> tuple[float, list[str]]:
+    """Median import time of `module` in fresh interpreters, plus lazy leaks."""
+    timings = []
+    for _ in range(runs):
+        (elapsed,) = _probe(_TIMING_PROBE.format(module=module), module, "elapsed")
+        timings.append(float(elapsed))
+    loaded = _probe(
+        _LAZY_PROBE.format(module=module, lazy=LAZY_MODULES), module, "loaded"
+    )
+    return statistics.median(timings), loaded
+
+
+def _new_session(points: int):
+    import reflex as rx
+
+    from app.state import State
+
+    root = rx.State(_reflex_internal_init=True)
+    state = root.get_substate(State.get_full_name().split("."))
+    if points:
+        # Go through the same path as uploads so the duplicate grid is built too.
+        state._ingest(
+            [
+                {"name": f"Point {i}", "lat": (i % 160) - 80.0, "lng": i % 340 - 170.0}
+                for i in range(points)
+            ]
+        )
+    # Live sessions hold the computed buffers cached, so count them too.
+    state.buffer_geometries
+    return root, state
+
+
+def measure_sessions(sessions: int, points: int) -> tuple[float, int]:
+    """Average in-memory bytes per session and serialized bytes of one session."""
+    _new_session(points)  # Warm up class-level caches before measuring.
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [_new_session(points) for _ in range(sessions)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    serialized = len(kept[0][1]._serialize())
+    return (after - before) / sessions, serialized
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh imports to time")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument(
+        "--points", type=int, default=100, help="points in the loaded-session case"
+    )
+    args = parser.parse_args()
+
+    for module in ("app.state", "app.app"):
+        try:
+            seconds, loaded = measure_import(module, args.runs)
+        except RuntimeError as e:
+            print(f"import {module:<10} skipped, {e}")
+            continue
+        print(f"import {module:<10} {seconds * 1000:8.1f} ms")
+        if loaded:
+            print(f"  eagerly loaded: {', '.join(loaded)}")
+    for points in (0, args.points):
+        per_session, serialized = measure_sessions(args.sessions, points)
+        print(
+            f"session ({points:>4} points) {per_session / 1024:8.1f} KiB in memory, "
+            f"{serialized / 1024:.1f} KiB serialized"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,412 @@
+"""Multi-session load test against a local instance of the app.
+
+Starts the backend (or targets an existing one with --url), opens N concurrent
+websocket sessions and replays a realistic mix of CSV uploads, map clicks,
+buffer setting changes and GeoJSON/Shapefile exports, then reports throughput,
+p50/p99 event latency and backend memory per session. The backend's output goes
+to --log and its tail is printed if the run fails.
+
+    pip install -r requirements-loadtest.txt
+    python scripts/load_test.py --sessions 50 --events 40
+
+Needs `psutil` (reflex only pulls it in on Windows) and `aiohttp`, which the
+socket.io client uses for its websocket transport.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from typing import Optional
+
+import httpx
+import psutil
+import socketio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.state import State  # noqa: E402
+
+EVENT_MIX = {
+    "map_click": 0.4,
+    "set_distance": 0.15,
+    "set_type": 0.1,
+    "set_geodesic": 0.1,
+    "export_geojson": 0.1,
+    "export_shapefile": 0.05,
+    "csv_upload": 0.1,
+}
+ROUTER_DATA = {"pathname": "/", "query": {}, "asPath": "/"}
+EVENT_TIMEOUT = 30.0
+READY_TIMEOUT = 5.0
+LOG_TAIL_LINES = 40
+
+
+def _handler(name: str) -> str:
+    return f"{State.get_full_name()}.{name}"
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _csv_payload(rng: random.Random, rows: int) -> bytes:
+    lines = ["name,lat,lng"]
+    for i in range(rows):
+        lat = rng.uniform(-60, 60)
+        lng = rng.uniform(-170, 170)
+        lines.append(f"Site {i},{lat:.6f},{lng:.6f}")
+    # Repeat a few rows so duplicate detection is exercised as well.
+    lines.extend(lines[1 : 1 + rows // 10])
+    return "\n".join(lines).encode("utf-8")
+
+
+def _tree_rss(pid: int) -> int:
+    """Resident memory of a process and all of its children, in bytes."""
+    try:
+        proc = psutil.Process(pid)
+        procs = [proc, *proc.children(recursive=True)]
+    except psutil.NoSuchProcess:
+        return 0
+    total = 0
+    for p in procs:
+        try:
+            total += p.memory_info().rss
+        except psutil.NoSuchProcess:
+            continue
+    return total
+
+
+class Session:
+    """One simulated analyst: a websocket client with its own state token."""
+
+    def __init__(self, url: str, rng: random.Random):
+        self.url = url
+        self.rng = rng
+        self.token = str(uuid.uuid4())
+        self.sio = socketio.AsyncClient(reconnection=False)
+        self._pending: Optional[asyncio.Future] = None
+        self.sio.on("event", self._on_update)
+
+    async def _on_update(self, data):
+        update = json.loads(data) if isinstance(data, str) else data
+        if update.get("final", True) and self._pending and not self._pending.done():
+            self._pending.set_result(None)
+
+    async def connect(self):
+        await self.sio.connect(
+            f"{self.url}?token={self.token}",
+            socketio_path="/_event",
+            transports=["websocket"],
+        )
+
+    async def close(self):
+        await self.sio.disconnect()
+
+    async def emit(self, handler: str, payload: dict, timeout: float = EVENT_TIMEOUT):
+        self._pending = asyncio.get_running_loop().create_future()
+        await self.sio.emit(
+            "event",
+            {
+                "token": self.token,
+                "name": _handler(handler),
+                "router_data": ROUTER_DATA,
+                "payload": payload,
+            },
+        )
+        try:
+            await asyncio.wait_for(self._pending, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"no final update for {_handler(handler)} within {timeout}s"
+            ) from None
+
+    async def upload(self, client: httpx.AsyncClient):
+        response = await client.post(
+            f"{self.url}/_upload",
+            headers={
+                "Reflex-Client-Token": self.token,
+                "Reflex-Event-Handler": _handler("handle_csv_upload"),
+            },
+            files={"files": ("points.csv", _csv_payload(self.rng, 50), "text/csv")},
+            timeout=EVENT_TIMEOUT,
+        )
+        response.raise_for_status()
+        await response.aread()
+
+    async def run_event(self, kind: str, client: httpx.AsyncClient):
+        if kind == "map_click":
+            latlng = {
+                "lat": self.rng.uniform(-60, 60),
+                "lng": self.rng.uniform(-170, 170),
+            }
+            await self.emit("handle_map_click", {"event": {"latlng": latlng}})
+        elif kind == "set_distance":
+            distance = str(self.rng.choice([250, 500, 1000, 5000, 25000]))
+            await self.emit("set_buffer_distance", {"distance": distance})
+        elif kind == "set_type":
+            buffer_type = self.rng.choice(["circle", "square"])
+            await self.emit("set_buffer_type", {"type": buffer_type})
+        elif kind == "set_geodesic":
+            geodesic = self.rng.choice([True, False])
+            await self.emit("set_buffer_geodesic", {"geodesic": geodesic})
+        elif kind == "export_geojson":
+            await self.emit("download_geojson", {})
+        elif kind == "export_shapefile":
+            await self.emit("download_shapefile", {})
+        elif kind == "csv_upload":
+            await self.upload(client)
+
+
+async def _run_session(
+    session: Session,
+    events: int,
+    think_time: float,
+    client: httpx.AsyncClient,
+    latencies: dict[str, list[float]],
+    errors: dict[str, int],
+    first_errors: dict[str, str],
+):
+    kinds = list(EVENT_MIX)
+    weights = list(EVENT_MIX.values())
+    for _ in range(events):
+        kind = session.rng.choices(kinds, weights)[0]
+        start = time.perf_counter()
+        try:
+            await session.run_event(kind, client)
+            latencies[kind].append(time.perf_counter() - start)
+        except Exception as e:
+            errors[kind] += 1
+            first_errors.setdefault(kind, f"{type(e).__name__}: {e}")
+        if think_time:
+            await asyncio.sleep(session.rng.uniform(0, think_time))
+
+
+async def run_load_test(
+    url: str,
+    sessions: int,
+    events: int,
+    think_time: float,
+    seed: int,
+    pid: Optional[int],
+) -> dict:
+    """Drives the sessions concurrently and returns the collected metrics."""
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    first_errors: dict[str, str] = {}
+    async with httpx.AsyncClient() as client:
+        # Warm up once so lazy imports and caches are not billed to the sessions.
+        warmup = Session(url, random.Random(seed - 1))
+        await warmup.connect()
+        for kind in EVENT_MIX:
+            await warmup.run_event(kind, client)
+        await warmup.close()
+    rss_before = _tree_rss(pid) if pid else 0
+    clients = [Session(url, random.Random(seed + i)) for i in range(sessions)]
+    outcomes = await asyncio.gather(
+        *(s.connect() for s in clients), return_exceptions=True
+    )
+    connected = []
+    for session, outcome in zip(clients, outcomes):
+        if isinstance(outcome, Exception):
+            errors["connect"] += 1
+            first_errors.setdefault(
+                "connect", f"{type(outcome).__name__}: {outcome}"
+            )
+        else:
+            connected.append(session)
+    if not connected:
+        raise RuntimeError(f"No session could connect: {first_errors['connect']}")
+    async with httpx.AsyncClient() as client:
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                _run_session(
+                    s, events, think_time, client, latencies, errors, first_errors
+                )
+                for s in connected
+            )
+        )
+        elapsed = time.perf_counter() - start
+    rss_after = _tree_rss(pid) if pid else 0
+    await asyncio.gather(*(s.close() for s in connected), return_exceptions=True)
+    all_latencies = [v for values in latencies.values() for v in values]
+    return {
+        "sessions": sessions,
+        "connected": len(connected),
+        "events": len(all_latencies),
+        "errors": dict(errors),
+        "first_errors": first_errors,
+        "elapsed_s": elapsed,
+        "throughput_eps": len(all_latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": _percentile(all_latencies, 50) * 1000,
+        "p99_ms": _percentile(all_latencies, 99) * 1000,
+        "by_event": {
+            kind: {
+                "count": len(values),
+                "p50_ms": _percentile(values, 50) * 1000,
+                "p99_ms": _percentile(values, 99) * 1000,
+            }
+            for kind, values in sorted(latencies.items())
+        },
+        "rss_per_session_bytes": (
+            (rss_after - rss_before) / len(connected) if pid else None
+        ),
+    }
+
+
+def _start_backend(port: int, log_path: str) -> subprocess.Popen:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    # The child keeps its own copy of the descriptor once started.
+    with open(log_path, "w") as log:
+        return subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "reflex",
+                "run",
+                "--env",
+                "prod",
+                "--backend-only",
+                "--backend-port",
+                str(port),
+                "--loglevel",
+                "warning",
+            ],
+            cwd=root,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+
+
+async def _round_trip(url: str):
+    session = Session(url, random.Random(0))
+    try:
+        await asyncio.wait_for(session.connect(), READY_TIMEOUT)
+        await session.emit("set_buffer_type", {"type": "circle"}, READY_TIMEOUT)
+    finally:
+        await session.close()
+
+
+def _wait_until_ready(
+    url: str, backend: Optional[subprocess.Popen], timeout: float = 120.0
+):
+    """Waits until the backend processes an event end to end.
+
+    /ping answers as soon as the server is up, even when the app module failed
+    to load, so readiness is a real event round trip instead.
+    """
+    deadline = time.monotonic() + timeout
+    last_error = None
+    while time.monotonic() < deadline:
+        if backend is not None and backend.poll() is not None:
+            raise RuntimeError(f"Backend exited with status {backend.returncode}.")
+        try:
+            asyncio.run(_round_trip(url))
+            return
+        except Exception as e:
+            last_error = f"{type(e).__name__}: {e}"
+        time.sleep(0.5)
+    raise TimeoutError(
+        f"Backend at {url} did not answer an event in {timeout}s ({last_error})."
+    )
+
+
+def _print_log_tail(log_path: str):
+    try:
+        with open(log_path) as f:
+            lines = f.readlines()[-LOG_TAIL_LINES:]
+    except OSError:
+        return
+    print(f"--- last {len(lines)} lines of {log_path} ---", file=sys.stderr)
+    sys.stderr.writelines(lines)
+
+
+def _print_report(results: dict):
+    print(f"sessions       {results['connected']}/{results['sessions']} connected")
+    print(f"events         {results['events']} in {results['elapsed_s']:.2f}s")
+    print(f"throughput     {results['throughput_eps']:.1f} events/s")
+    print(f"latency p50    {results['p50_ms']:.1f} ms")
+    print(f"latency p99    {results['p99_ms']:.1f} ms")
+    for kind, stats in results["by_event"].items():
+        print(
+            f"  {kind:<14} n={stats['count']:<6} "
+            f"p50={stats['p50_ms']:.1f} ms  p99={stats['p99_ms']:.1f} ms"
+        )
+    if results["errors"]:
+        print(f"errors         {results['errors']}")
+        for kind, message in sorted(results["first_errors"].items()):
+            print(f"  {kind:<14} first: {message}")
+    if results["rss_per_session_bytes"] is not None:
+        print(f"memory/session {results['rss_per_session_bytes'] / 1024:.1f} KiB RSS")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--events", type=int, default=30, help="events per session")
+    parser.add_argument(
+        "--think-time", type=float, default=0.0, help="max pause between events (s)"
+    )
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--url", help="target an already running backend instead of starting one"
+    )
+    parser.add_argument(
+        "--pid", type=int, help="backend pid for memory stats when using --url"
+    )
+    parser.add_argument(
+        "--log",
+        default=os.path.join(tempfile.gettempdir(), "geobuffer-backend.log"),
+        help="where to write the started backend's output",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    backend = None
+    url = args.url
+    pid = args.pid
+    if url is None:
+        url = f"http://localhost:{args.port}"
+        backend = _start_backend(args.port, args.log)
+        pid = backend.pid
+    try:
+        _wait_until_ready(url, backend)
+        results = asyncio.run(
+            run_load_test(
+                url, args.sessions, args.events, args.think_time, args.seed, pid
+            )
+        )
+    except BaseException:
+        if backend is not None:
+            _print_log_tail(args.log)
+        raise
+    finally:
+        if backend is not None:
+            try:
+                for child in psutil.Process(backend.pid).children(recursive=True):
+                    child.terminate()
+            except psutil.NoSuchProcess:
+                pass
+            backend.terminate()
+            backend.wait()
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_report(results)
+
+
+if __name__ == "__main__":
+    main()
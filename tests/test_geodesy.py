@@ -0,0 +1,57 @@
+import math
+
+import pytest
+
+from app import geodesy
+
+# Direct-problem reference values (GeographicLib, WGS84): lat, lng, bearing,
+# distance -> lat2, lng2.
+DIRECT_CASES = [
+    # Vincenty's Flinders Peak -> Buninyong example, long enough for Vincenty.
+    (
+        -37.95103341666667,
+        144.42486788888888,
+        306.8681583333333,
+        54972.271,
+        -37.652821145636054,
+        143.92649552332222,
+    ),
+    # Buffer-scale distances, solved by the series.
+    (51.4779, -0.0015, 45.0, 1000.0, 51.484255147385205, 0.008679406476351575),
+    (-33.8688, 151.2093, 200.0, 2500.0, -33.88997912615304, 151.20005658440869),
+    (69.6492, 18.9553, 90.0, 500.0, 69.64919952776751, 18.968177415092754),
+    (60.1699, 24.9384, 135.0, 10000.0, 60.10637269095294, 25.065530033357796),
+]
+
+
+@pytest.mark.parametrize("lat, lng, bearing, distance, lat2, lng2", DIRECT_CASES)
+def test_direct_problem_matches_reference(lat, lng, bearing, distance, lat2, lng2):
+    table = geodesy._bearing_table([bearing])
+    [(got_lat, got_lng)] = geodesy._destinations([(lat, lng)], distance, table)[0]
+    assert got_lat == pytest.approx(lat2, abs=1e-8)
+    assert got_lng == pytest.approx(lng2, abs=1e-8)
+
+
+def test_ring_is_counter_clockwise():
+    ring = geodesy.geodesic_rings([(40.0, -74.0)], 1000.0)[0]
+    # Shoelace formula with x = lng, y = lat: positive means counter-clockwise.
+    area = sum(
+        ring[i - 1][1] * ring[i][0] - ring[i][1] * ring[i - 1][0]
+        for i in range(len(ring))
+    )
+    assert len(ring) == geodesy.RING_VERTICES
+    assert area > 0
+
+
+def test_antimeridian_stays_continuous():
+    ((south, west, north, east),) = geodesy.geodesic_boxes([(40.0, 179.999)], 1000.0)
+    assert south < north
+    assert west < 179.999 < east
+    ring = geodesy.geodesic_rings([(40.0, 179.999)], 1000.0)[0]
+    assert max(lng for _, lng in ring) - min(lng for _, lng in ring) < 1.0
+    assert all(math.isfinite(lat) for lat, _ in ring)
+
+
+def test_negative_distance_near_pole_stays_on_the_globe():
+    ring = geodesy.geodesic_rings([(90.0, 0.0)], -1000.0)[0]
+    assert all(89.9 < lat <= 90.0 for lat, _ in ring)
@@ -0,0 +1,118 @@
+import pickle
+import random
+
+import pytest
+
+from app import ingest
+from app.ingest import HashGrid, ingest_points
+
+
+def _point(name, lat, lng):
+    return {"name": name, "lat": lat, "lng": lng}
+
+
+def _ingest(existing, incoming, tolerance=1.0, mode="drop"):
+    points = [dict(p) for p in existing]
+    grid = HashGrid.from_points(points, tolerance)
+    return points, grid, ingest_points(points, incoming, grid, mode)
+
+
+@pytest.mark.parametrize(
+    "mode, length, counts",
+    [
+        ("drop", 2, (1, 2, 0, 0)),
+        ("merge", 2, (1, 0, 2, 0)),
+        ("snap", 4, (1, 0, 0, 2)),
+    ],
+)
+def test_mode_counts(mode, length, counts):
+    existing = [_point("a", 40.0, -74.0)]
+    incoming = [
+        _point("b", 40.000005, -74.000005),
+        _point("c", 40.1, -74.0),
+        _point("a", 40.0, -74.0),
+    ]
+    points, _, result = _ingest(existing, incoming, mode=mode)
+    assert len(points) == length
+    assert (
+        result["added"],
+        result["dropped"],
+        result["merged"],
+        result["snapped"],
+    ) == counts
+    if mode == "snap":
+        assert {(p["lat"], p["lng"]) for p in points} == {(40.0, -74.0), (40.1, -74.0)}
+
+
+@pytest.mark.parametrize(
+    "lng1, lng2", [(179.99999, -179.99999), (-179.99999, 179.99999)]
+)
+def test_antimeridian_neighbours(lng1, lng2):
+    _, _, result = _ingest([_point("a", 10.0, lng1)], [_point("b", 10.0, lng2)], 5.0)
+    assert result["dropped"] == 1
+
+
+def test_merge_unwraps_longitude_across_antimeridian():
+    points, _, result = _ingest(
+        [_point("a", 10.0, 179.99999)], [_point("b", 10.0, -179.99997)], 5.0, "merge"
+    )
+    assert result["merged"] == 1
+    assert points[0]["name"] == "a + b"
+    assert points[0]["lng"] == pytest.approx(-179.99999, abs=1e-6)
+
+
+@pytest.mark.parametrize("lat", [89.99999, -89.99999])
+def test_pole_rows(lat):
+    # Same spot near the pole, described with very different longitudes.
+    existing = [_point("a", lat, 0.0)]
+    _, _, result = _ingest(existing, [_point("b", lat, 120.0)], 5.0)
+    assert result["dropped"] == 1
+    _, _, result = _ingest(existing, [_point("c", -lat, 0.0)], 5.0)
+    assert result["added"] == 1
+
+
+def test_zero_tolerance_matches_exactly():
+    existing = [_point("a", 1.0, 2.0)]
+    incoming = [_point("b", 1.0, 2.0), _point("c", 1.0, 2.0000001)]
+    points, _, result = _ingest(existing, incoming, 0.0)
+    assert (result["added"], result["dropped"]) == (1, 1)
+    assert len(points) == 2
+
+
+def test_move_after_merge():
+    points, grid, _ = _ingest(
+        [_point("a", 0.0, 0.0)], [_point("b", 0.0, 0.000016)], 2.0, "merge"
+    )
+    merged = points[0]
+    assert merged["lng"] == pytest.approx(0.000008)
+    assert grid.find(merged["lat"], merged["lng"], points) == 0
+    # The old cell no longer holds the point, and nothing is indexed twice.
+    assert sum(len(v) for v in grid.cells.values()) == 1
+
+
+def test_pickled_grid_is_stale_and_empty():
+    points = [_point("a", 1.0, 2.0)]
+    grid = pickle.loads(pickle.dumps(HashGrid.from_points(points, 1.0)))
+    assert grid.stale
+    assert grid.cells == {}
+
+
+def test_find_matches_brute_force():
+    rng = random.Random(7)
+    tolerance = 50.0
+    points = []
+    grid = HashGrid(tolerance)
+    for i in range(400):
+        lat = rng.uniform(-89.9, 89.9)
+        lng = rng.uniform(-180, 180)
+        grid.add(i, lat, lng)
+        points.append(_point(str(i), lat, lng))
+    for _ in range(2000):
+        base = rng.choice(points)
+        lat = max(-90.0, min(90.0, base["lat"] + rng.uniform(-1e-3, 1e-3)))
+        lng = (base["lng"] + rng.uniform(-2e-3, 2e-3) + 180) % 360 - 180
+        expected = any(
+            ingest._distance_m(lat, lng, p["lat"], p["lng"]) <= tolerance
+            for p in points
+        )
+        assert (grid.find(lat, lng, points) is not None) == expected